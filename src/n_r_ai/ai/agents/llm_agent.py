@@ -1,6 +1,7 @@
 from __future__ import annotations
 import json
-from typing import Any, List, Mapping
+from functools import lru_cache
+from typing import Any, Mapping, Sequence
 
 from ...core.game_state import GameState
 from ...core.actions import Action, ActionType
@@ -12,31 +13,74 @@ from ...core import actions as act
 
 from ...server.llm import LLMConfig, llm_choose_action
 
+
 class LLMAgent:
     def __init__(self, rules: Rules | None = None, persona: str | None = None, temperature: float | None = None) -> None:
         self.rules = rules or Rules()
         self.persona = persona
         self.temperature = temperature
         self.cfg = LLMConfig()
+        # Last summarised action sequence; Rules hands out shared immutable tuples.
+        self._summarized: tuple[Sequence[Action], list[dict[str, Any]]] | None = None
+        # Greedy picks, cached per agent so the cache never pins another agent's config.
+        self._cached_pick = lru_cache(maxsize=4096)(self._llm_pick)
+
+    def _llm_pick(
+        self,
+        state_summary: str,
+        actions_key: tuple[tuple[str, tuple[tuple[str, Any], ...]], ...],
+        persona: str | None,
+        temperature: float,
+        model: str,
+        base_url: str | None,
+        response_format: str,
+    ) -> int:
+        # model/base_url/response_format are only part of the cache key; self.cfg holds them.
+        actions_summary = [
+            {"index": i, "type": t, "params": dict(params) if params else None}
+            for i, (t, params) in enumerate(actions_key)
+        ]
+        res = llm_choose_action(state_summary, actions_summary, persona=persona, temperature=temperature, config=self.cfg)
+        return res["pick"]
 
     def summarize_state(self, state: GameState) -> str:
         return f"turn={state.turn}, phase={state.phase.name}, seed={state.seed}"
 
-    def summarize_actions(self, actions: List[Action]) -> list[dict[str, Any]]:
-        out: list[dict[str, Any]] = []
-        for i, a in enumerate(actions):
-            out.append({"index": i, "type": a.type.name, "params": dict(a.params) if a.params else None})
-        return out
+    def summarize_actions(self, actions: Sequence[Action]) -> list[dict[str, Any]]:
+        return [{"index": i, "type": a.type.name, "params": a.params or None} for i, a in enumerate(actions)]
 
     def act(self, state: GameState) -> Action:
         actions = self.rules.legal_actions(state)
         if not actions:
-            return Action(ActionType.NOOP)
+            return Action.of(ActionType.NOOP)
         if len(actions) == 1:
             return actions[0]
 
         state_summary = self.summarize_state(state)
-        actions_summary = self.summarize_actions(actions)
+        cached = self._summarized
+        if cached is not None and cached[0] is actions:
+            actions_summary = cached[1]
+        else:
+            actions_summary = self.summarize_actions(actions)
+            self._summarized = (actions, actions_summary)
+
+        temperature = self.temperature if self.temperature is not None else self.cfg.temperature
+        if temperature <= 0:
+            # Greedy decoding is deterministic, so identical prompts can reuse the answer.
+            actions_key = tuple(
+                (d["type"], tuple(sorted((d["params"] or {}).items()))) for d in actions_summary
+            )
+            try:
+                hash(actions_key)
+            except TypeError:
+                pass  # unhashable params: fall through to an uncached call
+            else:
+                cfg = self.cfg
+                idx = self._cached_pick(
+                    state_summary, actions_key, self.persona, temperature,
+                    cfg.model, cfg.base_url, cfg.response_format,
+                )
+                return actions[idx]
 
         res = llm_choose_action(state_summary, actions_summary, persona=self.persona, temperature=self.temperature, config=self.cfg)
         idx = res["pick"]
@@ -10,5 +10,8 @@ class RandomAgent:
         self.rng = random.Random(seed)
 
     def act(self, state: GameState) -> Action:
-        actions = self.rules.legal_actions(state)
-        return self.rng.choice(actions)
+        action = self.rules.sample_legal_action(state, self.rng)
+        if action is None:
+            # Same failure as rng.choice on an empty action list.
+            raise IndexError("Cannot choose from an empty sequence")
+        return action
@@ -1,100 +1,200 @@
 from __future__ import annotations
 import math
 import random
-from typing import Callable
-from .node import Node
+from typing import Sequence
+from .node import Arena
 from ...core.game_state import GameState
 from ...core.actions import Action
 from ...core.rules import Rules
 from ...engine.simulator import step
-
-Policy = Callable[[GameState, list[Action]], list[float]]
+from ..policy import Policy
 
 class MCTS:
-    def __init__(self, rules: Rules | None = None, policy: Policy | None = None) -> None:
+    def __init__(self, rules: Rules | None = None, policy: Policy | None = None, seed: int | None = None) -> None:
         self.rules = rules or Rules()
         self.policy = policy
         self.c_puct = 1.0
-        self.root = Node()
-        self.rng = random.Random()
+        self.arena = Arena()
+        # Transposition table: every distinct state owns exactly one arena node.
+        self.tt: dict[GameState, int] = {}
+        # Legal actions of tree states seen during the current search; rollouts sample
+        # through rules.sample_legal_action instead.
+        self._legal: dict[GameState, Sequence[Action]] = {}
+        self.rng = random.Random(seed)
+        self.max_depth = 100
+        self.rollout_depth = 20
+        self.virtual_loss = 1
+        # Nodes expanded during a batch whose policy priors are still to be computed.
+        self._pending: list[tuple[int, GameState, Sequence[Action]]] | None = None
 
-    def search(self, state: GameState, iters: int = 100) -> Action:
+    def search(self, state: GameState, iters: int = 100, batch: int = 1) -> Action:
+        arena = self.arena
+        # Reset before any early return so root_visits() never reports a previous search.
+        arena.clear()
+        self.tt.clear()
+        self._legal.clear()
         actions = self.rules.legal_actions(state)
         if len(actions) == 1:
             return actions[0]
-        self.root = Node()
-        for _ in range(iters):
-            self._search_iter(state.next(), self.root, 0)
-        best_action = None
-        best_count = -1
-        for action in actions:
-            action_str = str(action)
-            if action_str in self.root.children:
-                child = self.root.children[action_str]
-                if child.N > best_count:
-                    best_count = child.N
-                    best_action = action
-        return best_action or actions[0]
+        root = self.tt[state] = arena.add(state)
+        remaining = iters
+        while remaining > 0:
+            k = min(batch, remaining)
+            self._search_batch(root, k)
+            remaining -= k
+        edges = arena.edges(root)
+        if not edges:
+            return actions[0]
+        edge_N, edge_W = arena.edge_N, arena.edge_W
+        return arena.action[max(edges, key=lambda e: (edge_N[e], edge_W[e]))]
 
-    def _search_iter(self, state: GameState, node: Node, depth: int) -> float:
-        if depth > 100:
-            return 0.0
-        actions = self.rules.legal_actions(state)
-        if not actions:
-            return 0.0
-        if not node.children and node.N > 0:
-            self._expand(node, state, actions)
-        if not node.children:
-            node.N += 1
-            return self._simulate(state)
-        action, child = self._select_child(node, actions)
-        next_state = step(state, action, self.rules)
-        value = self._search_iter(next_state, child, depth + 1)
-        node.N += 1
-        node.W += value
-        node.Q = node.W / node.N
-        return value
+    def root_visits(self) -> dict[Action, int]:
+        """Visit counts of the root's actions from the most recent search."""
+        arena = self.arena
+        if not len(arena):
+            return {}
+        return {arena.action[e]: arena.edge_N[e] for e in arena.edges(0)}
+
+    def _search_batch(self, root: int, k: int) -> None:
+        """Run ``k`` simulations whose descents are selected before any is backed up.
+
+        With ``k > 1`` every finished descent leaves a virtual loss on its path so
+        the following descents spread over other branches; policy priors for the
+        nodes expanded meanwhile are requested together once all descents are done.
+        """
+        vloss = self.virtual_loss if k > 1 else 0
+        if k > 1:
+            self._pending = []
+        descents = [self._descend(root, vloss) for _ in range(k)]
+        if self._pending is not None:
+            self._flush_pending()
+            self._pending = None
+        arena = self.arena
+        N, W, Q = arena.N, arena.W, arena.Q
+        edge_N, edge_W = arena.edge_N, arena.edge_W
+        for path, edges, leaf in descents:
+            value = self._simulate(leaf) if leaf is not None else 0.0
+            for node in path:
+                N[node] += 1 - vloss
+                W[node] += value + vloss
+                Q[node] = W[node] / N[node]
+            for e in edges:
+                edge_N[e] += 1 - vloss
+                edge_W[e] += value + vloss
+
+    def _descend(self, root: int, vloss: int) -> tuple[list[int], list[int], GameState | None]:
+        """Walk from ``root`` to a leaf; returns the nodes and edges taken and the state to roll out from."""
+        arena = self.arena
+        N, W, Q = arena.N, arena.W, arena.Q
+        node = root
+        path = [root]
+        edges: list[int] = []
+        on_path = {root}
+        leaf = None
+        while len(path) <= self.max_depth:
+            state = arena.state[node]
+            actions = arena.legal[node]
+            if actions is None:
+                actions = arena.legal[node] = self._legal_actions(state)
+            if not actions:
+                break
+            if not arena.n_children[node] and N[node] > 0:
+                self._expand(node, state, actions)
+            if not arena.n_children[node]:
+                leaf = state
+                break
+            edge = self._select_child(node)
+            child = arena.child_idx[edge]
+            # A transposition can loop back onto the current descent; stop there.
+            if child in on_path:
+                break
+            node = child
+            path.append(child)
+            edges.append(edge)
+            on_path.add(child)
+        if vloss:
+            for node in path:
+                N[node] += vloss
+                W[node] -= vloss
+                Q[node] = W[node] / N[node]
+            edge_N, edge_W = arena.edge_N, arena.edge_W
+            for e in edges:
+                edge_N[e] += vloss
+                edge_W[e] -= vloss
+        return path, edges, leaf
+
+    def _legal_actions(self, state: GameState) -> Sequence[Action]:
+        actions = self._legal.get(state)
+        if actions is None:
+            actions = self._legal[state] = self.rules.legal_actions(state)
+        return actions
+
+    def _resolve_forced(self, state: GameState) -> GameState:
+        """Play out forced moves so a chain of single-action states becomes one tree edge."""
+        for _ in range(self.max_depth):
+            actions = self._legal_actions(state)
+            if len(actions) != 1:
+                break
+            state = step(state, actions[0], self.rules)
+        return state
 
-    def _expand(self, node: Node, state: GameState, actions: list[Action]) -> None:
+    def _expand(self, node: int, state: GameState, actions: Sequence[Action]) -> None:
         probs = None
         if self.policy:
-            probs = self.policy(state, actions)
-        for i, action in enumerate(actions):
-            p = probs[i] if probs else 1.0 / len(actions)
-            node.children[str(action)] = Node(action=action, P=p)
-
-    def _select_child(self, node: Node, actions: list[Action]):
-        best_score = float('-inf')
-        best_action = None
-        best_child = None
+            if self._pending is not None:
+                self._pending.append((node, state, actions))
+            else:
+                probs = self.policy([state], [actions])[0]
+        arena = self.arena
+        tt = self.tt
+        children = []
         for action in actions:
-            action_str = str(action)
-            if action_str not in node.children:
-                continue
-            child = node.children[action_str]
-            exploit = child.Q
-            explore = self.c_puct * child.P * math.sqrt(node.N) / (1 + child.N)
-            score = exploit + explore
-            if score > best_score:
-                best_score = score
-                best_action = action
-                best_child = child
-        if best_action is None and actions:
-            best_action = actions[0]
-            action_str = str(best_action)
-            if action_str not in node.children:
-                node.children[action_str] = Node(action=best_action)
-            best_child = node.children[action_str]
-        return best_action, best_child
+            next_state = self._resolve_forced(step(state, action, self.rules))
+            child = tt.get(next_state)
+            if child is None:
+                child = tt[next_state] = arena.add(next_state)
+            children.append(child)
+        arena.expand(node, actions, children, probs)
+
+    def _flush_pending(self) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        probs_list = self.policy([state for _, state, _ in pending], [actions for _, _, actions in pending])
+        if len(probs_list) != len(pending):
+            raise ValueError(f"policy returned {len(probs_list)} prior lists for {len(pending)} states")
+        arena = self.arena
+        for (node, _, actions), probs in zip(pending, probs_list):
+            if probs:
+                if len(probs) != len(actions):
+                    raise ValueError(f"policy returned {len(probs)} priors for {len(actions)} actions")
+                start = arena.first_child[node]
+                arena.P[start : start + len(actions)] = probs
+
+    def _select_child(self, node: int) -> int:
+        arena = self.arena
+        edges = arena.edges(node)
+        if len(edges) == 1:
+            return edges.start
+        Q = arena.Q
+        explore = self.c_puct * math.sqrt(arena.N[node])
+        kids = arena.child_idx[edges.start : edges.stop]
+        priors = arena.P[edges.start : edges.stop]
+        visits = arena.edge_N[edges.start : edges.stop]
+        # Q is shared by every edge into a transposed child; the exploration bonus only
+        # counts visits made through this edge.
+        scores = [Q[c] + explore * p / (1 + n) for c, p, n in zip(kids, priors, visits)]
+        return edges.start + scores.index(max(scores))
 
     def _simulate(self, state: GameState) -> float:
+        rules = self.rules
+        sample = rules.sample_legal_action
+        rng = self.rng
         curr_state = state
-        depth = 0
-        while depth < 20:
-            actions = self.rules.legal_actions(curr_state)
-            if not actions:
+        for _ in range(self.rollout_depth):
+            # Rollout states rarely recur, so skip the legal-action memo and draw directly.
+            action = sample(curr_state, rng)
+            if action is None:
                 break
-            action = self.rng.choice(actions)
-            curr_state = step(curr_state, action, self.rules)
-            depth += 1
+            curr_state = step(curr_state, action, rules)
         return 0.0
@@ -1,13 +1,71 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import List, Optional, Sequence
 from ...core.actions import Action
+from ...core.game_state import GameState
 
-@dataclass
-class Node:
-    action: Optional[Action] = None
-    N: int = 0
-    W: float = 0.0
-    Q: float = 0.0
-    P: float = 1.0
-    children: Dict[str, "Node"] = field(default_factory=dict)
+class Arena:
+    """Struct-of-arrays storage for every node of a search graph.
+
+    Node ``i`` is row ``i`` of the node columns (``N``, ``W``, ``Q``, ``state``, ``legal``).
+    Its outgoing edges are rows ``first_child[i]`` .. ``first_child[i] + n_children[i] - 1``
+    of the edge columns (``action``, ``P``, ``child_idx``, ``edge_N``, ``edge_W``);
+    ``child_idx`` names the node an edge leads to, so transposed positions share a
+    single node. Node stats pool every visit to a position (shared Q); edge stats count
+    only the visits made through that particular edge.
+    """
+
+    def __init__(self) -> None:
+        self.N: List[int] = []
+        self.W: List[float] = []
+        self.Q: List[float] = []
+        self.state: List[Optional[GameState]] = []
+        self.legal: List[Optional[Sequence[Action]]] = []
+        self.first_child: List[int] = []
+        self.n_children: List[int] = []
+        self.action: List[Action] = []
+        self.P: List[float] = []
+        self.child_idx: List[int] = []
+        self.edge_N: List[int] = []
+        self.edge_W: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.N)
+
+    def clear(self) -> None:
+        for column in (
+            self.N, self.W, self.Q, self.state, self.legal, self.first_child, self.n_children,
+            self.action, self.P, self.child_idx, self.edge_N, self.edge_W,
+        ):
+            column.clear()
+
+    def add(self, state: Optional[GameState] = None) -> int:
+        self.N.append(0)
+        self.W.append(0.0)
+        self.Q.append(0.0)
+        self.state.append(state)
+        self.legal.append(None)
+        self.first_child.append(-1)
+        self.n_children.append(0)
+        return len(self.N) - 1
+
+    def expand(
+        self,
+        parent: int,
+        actions: Sequence[Action],
+        children: Sequence[int],
+        priors: Sequence[float] | None = None,
+    ) -> None:
+        n = len(actions)
+        if priors and len(priors) != n:
+            raise ValueError(f"expand got {len(priors)} priors for {n} actions")
+        self.first_child[parent] = len(self.child_idx)
+        self.n_children[parent] = n
+        self.action.extend(actions)
+        self.P.extend(priors if priors else [1.0 / n] * n)
+        self.child_idx.extend(children)
+        self.edge_N.extend([0] * n)
+        self.edge_W.extend([0.0] * n)
+
+    def edges(self, node: int) -> range:
+        start = self.first_child[node]
+        return range(start, start + self.n_children[node])
@@ -1,10 +1,16 @@
 from __future__ import annotations
-from typing import List
+from typing import Callable, List, Sequence
 from ..core.game_state import GameState
 from ..core.actions import Action
 
-def uniform_policy(state: GameState, actions: List[Action]) -> List[float]:
-    if not actions:
-        return []
-    p = 1.0 / len(actions)
-    return [p] * len(actions)
+# Batched: one call scores many states, so a model can run a single inference per batch.
+Policy = Callable[[Sequence[GameState], Sequence[Sequence[Action]]], List[List[float]]]
+
+def uniform_policy(states: Sequence[GameState], actions_list: Sequence[Sequence[Action]]) -> List[List[float]]:
+    return [[1.0 / len(actions)] * len(actions) if actions else [] for actions in actions_list]
+
+def batched(policy: Callable[[GameState, List[Action]], List[float]]) -> Policy:
+    """Adapt a legacy per-state ``policy(state, actions)`` to the batched signature."""
+    def run(states: Sequence[GameState], actions_list: Sequence[Sequence[Action]]) -> List[List[float]]:
+        return [policy(state, list(actions)) for state, actions in zip(states, actions_list)]
+    return run
@@ -7,7 +7,7 @@ def main() -> None:
     env = Environment()
     state = env.reset()
     for _ in range(3):
-        state, _, done, _ = env.step(Action(ActionType.NOOP))
+        state, _, done, _ = env.step(Action.of(ActionType.NOOP))
         if done:
             break
 
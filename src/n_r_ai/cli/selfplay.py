@@ -1,7 +1,13 @@
 from __future__ import annotations
+import os
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
 from ..engine.environment import Environment
 from ..ai.agents.random_agent import RandomAgent
+from ..ai.mcts.mcts import MCTS
 from ..core.actions import ActionType, Action
+from ..core.game_state import GameState
+from ..core.rules import Rules
 
 
 def run(steps: int = 5) -> None:
@@ -14,5 +20,44 @@ def run(steps: int = 5) -> None:
         if done:
             break
 
+
+def _search_worker(job: tuple[Rules, GameState, int, int]) -> dict[Action, int]:
+    rules, state, iters, seed = job
+    mcts = MCTS(rules, seed=seed)
+    mcts.search(state, iters)
+    return mcts.root_visits()
+
+
+def root_parallel_search(pool: PoolType, rules: Rules, state: GameState, iters: int, workers: int, seed: int = 0) -> Action:
+    """Split ``iters`` over independent per-process trees and vote by summed root visits.
+
+    Actions hash and compare by value, so equal actions returned by different
+    workers land on one tally.
+    """
+    actions = rules.legal_actions(state)
+    if len(actions) == 1:
+        return actions[0]
+    per_worker = max(1, iters // workers)
+    jobs = [(rules, state, per_worker, seed + i) for i in range(workers)]
+    totals: dict[Action, int] = {}
+    for visits in pool.map(_search_worker, jobs):
+        for action, n in visits.items():
+            totals[action] = totals.get(action, 0) + n
+    if not totals:
+        return actions[0]
+    return max(totals, key=totals.__getitem__)
+
+
+def run_parallel(steps: int = 5, workers: int | None = None, iters: int = 100) -> None:
+    workers = workers or os.cpu_count() or 1
+    env = Environment()
+    state = env.reset()
+    with Pool(workers) as pool:
+        for step in range(steps):
+            action = root_parallel_search(pool, env.rules, state, iters, workers, seed=step * workers)
+            state, _, done, _ = env.step(action)
+            if done:
+                break
+
 if __name__ == "__main__":
     run()
@@ -1,12 +1,69 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Mapping, Any
+from functools import lru_cache
+from typing import Mapping, Any, NoReturn
 
 class ActionType(Enum):
     NOOP = auto()
 
+def _params_key(params: Mapping[str, Any] | None) -> tuple[tuple[str, Any], ...]:
+    return tuple(sorted(params.items())) if params else ()
+
+class _Params(dict):
+    """Read-only dict owned by an Action, so the caller's mapping can change freely."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Action params are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_Params, (dict(self),))
+
 @dataclass(frozen=True)
 class Action:
     type: ActionType
     params: Mapping[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        params = self.params
+        if params is not None:
+            params = _Params(params)
+            object.__setattr__(self, "params", params)
+        try:
+            h = hash((self.type.value, _params_key(params)))
+        except TypeError:
+            # Unhashable or unorderable values (e.g. lists from JSON): hash the keys only.
+            h = hash((self.type.value, frozenset(params)))
+        # Plain instance attribute, not a dataclass field: stays out of fields() and asdict().
+        object.__setattr__(self, "_hash", h)
+
+    def __hash__(self) -> int:
+        # By value and computed once; equal actions hash equal within a process (str hashes are salted).
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild on unpickle: string hashes are salted per process, so _hash must not travel.
+        return (type(self), (self.type, self.params))
+
+    @classmethod
+    def of(cls, type: ActionType, params: Mapping[str, Any] | None = None) -> Action:
+        """Shared instance for ``(type, params)`` from a bounded cache; for engine-built actions."""
+        if cls is Action:
+            try:
+                return _shared(type, None if params is None else _typed_params_key(params))
+            except TypeError:
+                pass
+        return cls(type, params)
+
+def _typed_params_key(params: Mapping[str, Any]) -> tuple[tuple[str, type, Any], ...]:
+    # True == 1 == 1.0 as cache keys; the value's type keeps them apart.
+    return tuple(sorted((k, type(v), v) for k, v in params.items()))
+
+@lru_cache(maxsize=4096)
+def _shared(type: ActionType, params_key: tuple[tuple[str, type, Any], ...] | None) -> Action:
+    return Action(type, None if params_key is None else {k: v for k, _, v in params_key})
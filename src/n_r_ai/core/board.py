@@ -1,13 +1,45 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Set, Tuple
+import sys
+from dataclasses import dataclass, field
+from typing import AbstractSet, Dict, FrozenSet, Set, Tuple
 
 RoomId = str
+Edge = Tuple[RoomId, RoomId]
+
+_NO_NEIGHBORS: FrozenSet[RoomId] = frozenset()
+_NO_EDGES: Tuple[Edge, ...] = ()
+
+def norm_edge(a: RoomId, b: RoomId) -> Edge:
+    """Canonical (lower, higher) form of an undirected edge, as stored in ``Board.edges``."""
+    return (a, b) if a <= b else (b, a)
 
 @dataclass(frozen=True)
 class Board:
-    rooms: Set[RoomId]
-    edges: Set[Tuple[RoomId, RoomId]]
+    rooms: AbstractSet[RoomId]
+    edges: AbstractSet[Edge]
+    _adj: Dict[RoomId, FrozenSet[RoomId]] = field(init=False, repr=False, compare=False)
+    _incident: Dict[RoomId, Tuple[Edge, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Freeze once at construction so membership tests hash-probe and the board is hashable.
+        # Room names are interned so equal names from different sources compare by identity.
+        intern = sys.intern
+        object.__setattr__(self, "rooms", frozenset(intern(r) for r in self.rooms))
+        object.__setattr__(self, "edges", frozenset(norm_edge(intern(a), intern(b)) for a, b in self.edges))
+        adj: Dict[RoomId, Set[RoomId]] = {}
+        incident: Dict[RoomId, Set[Edge]] = {}
+        for edge in self.edges:
+            a, b = edge
+            adj.setdefault(a, set()).add(b)
+            adj.setdefault(b, set()).add(a)
+            incident.setdefault(a, set()).add(edge)
+            incident.setdefault(b, set()).add(edge)
+        object.__setattr__(self, "_adj", {r: frozenset(n) for r, n in adj.items()})
+        object.__setattr__(self, "_incident", {r: tuple(sorted(e)) for r, e in incident.items()})
+
+    def neighbors(self, r: RoomId) -> FrozenSet[RoomId]:
+        return self._adj.get(r, _NO_NEIGHBORS)
 
-    def neighbors(self, r: RoomId) -> Set[RoomId]:
-        return {b for a, b in self.edges if a == r} | {a for a, b in self.edges if b == r}
+    def incident_edges(self, r: RoomId) -> Tuple[Edge, ...]:
+        """Canonical edges touching ``r``, so per-room edge scans cost O(degree) not O(|edges|)."""
+        return self._incident.get(r, _NO_EDGES)
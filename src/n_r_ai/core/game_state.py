@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, fields
 from enum import Enum, auto
 from typing import Any
 
@@ -9,11 +9,39 @@ class Phase(Enum):
     ENEMY = auto()
     CLEANUP = auto()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     turn: int = 0
     phase: Phase = Phase.SETUP
     seed: int | None = None
 
+    def key(self) -> tuple[Any, ...]:
+        """Canonical flat encoding of the state (enums as their int values)."""
+        return (self.turn, self.phase.value, self.seed)
+
+    def __hash__(self) -> int:
+        # Hash the int encoding; the generated hash would call the Python-level Enum.__hash__.
+        return hash(self.key())
+
     def next(self, **changes: Any) -> "GameState":
-        return replace(self, **changes)
+        # Copies slots directly instead of dataclasses.replace, which
+        # re-inspects fields() and re-runs __init__ on every call.
+        if not _FIELD_NAMES.issuperset(changes):
+            unknown = ", ".join(sorted(changes.keys() - _FIELD_NAMES))
+            raise TypeError(f"GameState has no field(s): {unknown}")
+        new = object.__new__(type(self))
+        for name, set_slot in _SLOT_SETTERS:
+            set_slot(new, changes[name] if name in changes else getattr(self, name))
+        return new
+
+    def tick(self) -> "GameState":
+        """Same state one turn later; the fast path for steps that change nothing else."""
+        new = object.__new__(type(self))
+        for name, set_slot in _SLOT_SETTERS:
+            set_slot(new, self.turn + 1 if name == "turn" else getattr(self, name))
+        return new
+
+_FIELD_NAMES = frozenset(f.name for f in fields(GameState))
+# Slot descriptors' C-level setters fill a fresh instance without going through the
+# frozen __setattr__; next() and tick() build copies with them.
+_SLOT_SETTERS = tuple((f.name, GameState.__dict__[f.name].__set__) for f in fields(GameState))
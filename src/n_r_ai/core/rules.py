@@ -1,11 +1,59 @@
 from __future__ import annotations
-from typing import List
+import random
+from typing import Iterable, Optional, Tuple
 from .game_state import GameState
 from .actions import Action, ActionType
 
+# Actions are frozen, so one shared tuple can be handed to every caller.
+_NOOP = Action.of(ActionType.NOOP)
+_DEFAULT_ACTIONS: Tuple[Action, ...] = (_NOOP,)
+
 class Rules:
-    def legal_actions(self, state: GameState) -> List[Action]:
-        return [Action(ActionType.NOOP)]
+    def legal_actions(self, state: GameState) -> Tuple[Action, ...]:
+        return _DEFAULT_ACTIONS
+
+    def first_legal(self, state: GameState, action_type: ActionType) -> Optional[Action]:
+        """First legal action of ``action_type``, or None; stops at the first match."""
+        for action in self.legal_actions(state):
+            if action.type is action_type:
+                return action
+        return None
+
+    def is_legal(self, state: GameState, action_type: ActionType) -> bool:
+        return self.first_legal(state, action_type) is not None
+
+    def sample_legal_action(self, state: GameState, rng: random.Random) -> Optional[Action]:
+        """One uniformly drawn legal action, or None if there are none.
+
+        Rollouts only need a single action per step; subclasses can override this to
+        materialise just the drawn action instead of the whole legal list.
+        """
+        actions = self.legal_actions(state)
+        n = len(actions)
+        if not n:
+            return None
+        # One float draw instead of Random.choice's rejection loop.
+        return actions[int(rng.random() * n)] if n > 1 else actions[0]
 
     def apply(self, state: GameState, action: Action) -> GameState:
-        return state.next(turn=state.turn + 1)
+        return state.tick()
+
+    def apply_sequence(
+        self, state: GameState, actions: Iterable[Action], *, validate: bool = False
+    ) -> GameState:
+        """Apply ``actions`` in order and return only the final state.
+
+        Trusted sequences (replays, scripted phase walks) skip the per-step legality
+        check; pass ``validate=True`` to raise ValueError on the first illegal action.
+        """
+        apply = self.apply
+        if validate:
+            legal_actions = self.legal_actions
+            for action in actions:
+                if action not in legal_actions(state):
+                    raise ValueError(f"Illegal action {action} in state {state}")
+                state = apply(state, action)
+        else:
+            for action in actions:
+                state = apply(state, action)
+        return state
@@ -1,9 +1,9 @@
 from __future__ import annotations
-from typing import Any, Tuple
+from typing import Any, List, Sequence, Tuple
 from ..core.game_state import GameState
 from ..core.actions import Action
 from ..core.rules import Rules
-from .simulator import step as sim_step
+from .simulator import step as sim_step, step_batch as sim_step_batch
 
 class Environment:
     def __init__(self, rules: Rules | None = None) -> None:
@@ -23,3 +23,49 @@ class Environment:
         reward = 0.0
         self.done = False
         return self.state, reward, self.done, {}
+
+class BatchEnvironment:
+    """N independent environments stepped together, e.g. for RL rollouts.
+
+    Holds the states as one list so a batch step is a single loop over
+    ``Rules.apply`` instead of N ``Environment.step`` calls.
+    """
+
+    def __init__(self, n: int, rules: Rules | None = None) -> None:
+        self.rules = rules or Rules()
+        self.states: List[GameState] = [GameState() for _ in range(n)]
+        self.done: List[bool] = [False] * n
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def reset(self, seeds: Sequence[int | None] | None = None) -> List[GameState]:
+        n = len(self.states)
+        if seeds is None:
+            seeds = [None] * n
+        elif len(seeds) != n:
+            raise ValueError(f"reset got {len(seeds)} seeds for {n} environments")
+        self.states = [GameState(seed=seed) for seed in seeds]
+        self.done = [False] * n
+        # Callers get their own list; mutating it must not touch the environment.
+        return list(self.states)
+
+    def step(
+        self, actions: Sequence[Action]
+    ) -> Tuple[List[GameState], List[float], List[bool], List[dict[str, Any]]]:
+        states, done = self.states, self.done
+        if len(actions) != len(states):
+            raise ValueError(f"step got {len(actions)} actions for {len(states)} environments")
+        if any(done):
+            # Finished games keep their final state, as in Environment.step.
+            live = [i for i, d in enumerate(done) if not d]
+            stepped = sim_step_batch([states[i] for i in live], [actions[i] for i in live], self.rules)
+            states = list(states)
+            for i, s in zip(live, stepped):
+                states[i] = s
+        else:
+            states = sim_step_batch(states, actions, self.rules)
+        self.states = states
+        n = len(states)
+        rewards = [0.0] * n
+        return list(states), rewards, list(done), [{} for _ in range(n)]
@@ -1,7 +1,15 @@
 from __future__ import annotations
+from typing import List, Sequence
 from ..core.game_state import GameState
 from ..core.actions import Action
 from ..core.rules import Rules
 
 def step(state: GameState, action: Action, rules: Rules) -> GameState:
     return rules.apply(state, action)
+
+def step_batch(states: Sequence[GameState], actions: Sequence[Action], rules: Rules) -> List[GameState]:
+    """Step N independent games at once; ``actions[i]`` is applied to ``states[i]``."""
+    if len(states) != len(actions):
+        raise ValueError(f"step_batch got {len(states)} states but {len(actions)} actions")
+    apply = rules.apply
+    return [apply(s, a) for s, a in zip(states, actions)]
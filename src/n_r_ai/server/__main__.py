@@ -1,8 +1,21 @@
 from __future__ import annotations
+import os
 import uvicorn
 
 def main() -> None:
-    uvicorn.run("n_r_ai.server.app:app", host="127.0.0.1", port=8000, reload=True)
+    # Auto-reload watches the source tree from a supervisor process; opt in for development only.
+    reload = os.getenv("NR_AI_RELOAD", "0") == "1"
+    workers = int(os.getenv("NR_AI_WORKERS", "1"))
+    uvicorn.run(
+        "n_r_ai.server.app:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=reload,
+        workers=None if reload else workers,
+        # uvloop/httptools when installed (uvicorn[standard]), asyncio/h11 otherwise.
+        loop="auto",
+        http="auto",
+    )
 
 if __name__ == "__main__":
     main()
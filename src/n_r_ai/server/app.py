@@ -1,17 +1,29 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import orjson
 
 from ..engine.environment import Environment
 from ..core.actions import Action, ActionType
 from ..core.rules import Rules
 from ..core.game_state import GameState
 
-app = FastAPI(title="n-r-ai server")
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Runs once per worker process, so every worker starts from a fresh game.
+    env.reset()
+    yield
+
+app = FastAPI(title="n-r-ai server", lifespan=_lifespan)
 
 env = Environment(Rules())
+# Handlers run on the event loop; serialise every read-modify-write of env.state.
+_env_lock = asyncio.Lock()
 
 origins = [
     "http://localhost:5173",
@@ -39,41 +51,78 @@ class StateOut(BaseModel):
     phase: str
     seed: Optional[int] = None
 
+class PydanticResponse(Response):
+    """JSON response rendered by pydantic's own serialiser, skipping jsonable_encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+# Outgoing models are built from trusted engine objects, so skip field validation;
+# only the request models (ActionIn, LLMActIn) validate.
 def state_to_out(s: GameState) -> StateOut:
-    return StateOut(turn=s.turn, phase=s.phase.name, seed=s.seed)
+    return StateOut.model_construct(turn=s.turn, phase=s.phase.name, seed=s.seed)
 
+# Actions are frozen and hash by value, so each one maps to a single
+# shared (read-only) ActionOut.
+@lru_cache(maxsize=4096)
 def action_to_out(a: Action) -> ActionOut:
-    return ActionOut(type=a.type.name, params=dict(a.params) if a.params else None)
+    return ActionOut.model_construct(type=a.type.name, params=dict(a.params) if a.params else None)
+
+@lru_cache(maxsize=1024)
+def _actions_payload(actions: Tuple[Action, ...]) -> Tuple[List[Dict[str, Any]], str]:
+    """ActionOut-shaped payload for a legal-action set, plus its JSON; treat both as read-only."""
+    payload = [
+        {"type": a.type.name, "params": dict(a.params) if a.params else None}
+        for a in actions
+    ]
+    return payload, orjson.dumps(payload).decode()
+
+_ACTION_TYPES: Dict[str, ActionType] = {t.name: t for t in ActionType}
 
 def parse_action(inp: ActionIn) -> Action:
-    try:
-        at = ActionType[inp.type]
-    except KeyError:
+    at = _ACTION_TYPES.get(inp.type)
+    if at is None:
         raise HTTPException(status_code=400, detail=f"Unknown action type: {inp.type}")
+    # Client input: build a fresh Action rather than filling the shared Action.of cache.
     return Action(at, inp.params)
 
-@app.on_event("startup")
-def _startup() -> None:
-    env.reset()
-
-@app.get("/api/state", response_model=StateOut)
-def get_state() -> StateOut:
-    return state_to_out(env.state)
+# Handlers return ready-rendered responses; the models are listed for the OpenAPI docs only.
+@app.get("/api/state", responses={200: {"model": StateOut}})
+async def get_state() -> PydanticResponse:
+    return PydanticResponse(state_to_out(env.state))
 
-@app.get("/api/actions", response_model=List[ActionOut])
-def get_actions() -> List[ActionOut]:
-    actions = env.rules.legal_actions(env.state)
-    return [action_to_out(a) for a in actions]
+@app.get("/api/actions", responses={200: {"model": List[ActionOut]}})
+async def get_actions() -> Response:
+    # Same shape as List[ActionOut], already serialised and cached per legal-action set.
+    _, actions_json = _actions_payload(tuple(env.rules.legal_actions(env.state)))
+    return Response(actions_json, media_type="application/json")
 
-@app.post("/api/step", response_model=StateOut)
-def post_step(a: ActionIn) -> StateOut:
+@app.post("/api/step", responses={200: {"model": StateOut}})
+async def post_step(a: ActionIn) -> PydanticResponse:
     action = parse_action(a)
-    s, _, _, _ = env.step(action)
-    return state_to_out(s)
+    async with _env_lock:
+        s, _, _, _ = await asyncio.to_thread(env.step, action)
+    return PydanticResponse(state_to_out(s))
 
 # --- LLM integration ---------------------------------------------------------
 
-from .llm import llm_choose_action  # noqa: E402
+from .llm import LLMConfig, llm_choose_action_async  # noqa: E402
+
+# Read the LLM settings once; the client behind it is shared across requests.
+llm_config = LLMConfig()
+
+
+def _prepare_prompt(
+    state: GameState, rules: Rules
+) -> Tuple[Sequence[Action], List[Dict[str, Any]], str, str]:
+    """Legal actions plus the prompt inputs for them; CPU work kept off the event loop."""
+    actions = rules.legal_actions(state)
+    # Legal-action sets repeat across requests; reuse their serialised form.
+    actions_payload, actions_json = _actions_payload(tuple(actions))
+    state_summary = f"turn={state.turn}, phase={state.phase.name}, seed={state.seed}"
+    return actions, actions_payload, actions_json, state_summary
 
 
 class LLMActIn(BaseModel):
@@ -87,35 +136,35 @@ class LLMActOut(BaseModel):
     state: StateOut
 
 
-@app.post("/api/llm_act", response_model=LLMActOut)
-def post_llm_act(body: LLMActIn) -> LLMActOut:
-    actions = env.rules.legal_actions(env.state)
-    actions_payload = [
-        {"type": a.type.name, "params": dict(a.params) if a.params else None}
-        for a in actions
-    ]
-    state_summary = (
-        f"turn={env.state.turn}, phase={env.state.phase.name}, seed={env.state.seed}"
-    )
-
-    try:
-        res = llm_choose_action(
-            state_summary,
-            actions_payload,
-            persona=body.persona,
-            temperature=body.temperature,
+@app.post("/api/llm_act", responses={200: {"model": LLMActOut}})
+async def post_llm_act(body: LLMActIn) -> PydanticResponse:
+    # Hold the lock across the LLM call so the pick is applied to the state it was made for.
+    async with _env_lock:
+        actions, actions_payload, actions_json, state_summary = await asyncio.to_thread(
+            _prepare_prompt, env.state, env.rules
         )
-    except RuntimeError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    idx = res["pick"]
-    rationale = res.get("rationale", "")
-    chosen = actions[idx] if actions else Action(ActionType.NOOP)
-
-    s, _, _, _ = env.step(chosen)
 
-    return LLMActOut(
+        try:
+            res = await llm_choose_action_async(
+                state_summary,
+                actions_payload,
+                persona=body.persona,
+                temperature=body.temperature,
+                config=llm_config,
+                actions_json=actions_json,
+            )
+        except RuntimeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        idx = res["pick"]
+        rationale = res.get("rationale", "")
+        chosen = actions[idx] if actions else Action.of(ActionType.NOOP)
+
+        s, _, _, _ = await asyncio.to_thread(env.step, chosen)
+
+    out = LLMActOut.model_construct(
         chosen=action_to_out(chosen),
         rationale=rationale,
         state=state_to_out(s),
     )
+    return PydanticResponse(out)
@@ -1,8 +1,18 @@
 from __future__ import annotations
-import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
+
+# One client (and so one keep-alive connection pool) per endpoint, shared by every call.
+@lru_cache(maxsize=8)
+def _client(api_key: str, base_url: str | None) -> OpenAI:
+    return OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+
+@lru_cache(maxsize=8)
+def _async_client(api_key: str, base_url: str | None) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key, base_url=base_url) if base_url else AsyncOpenAI(api_key=api_key)
 
 class LLMConfig:
     def __init__(self) -> None:
@@ -10,6 +20,13 @@ class LLMConfig:
         self.base_url = os.getenv("LLM_BASE_URL") or os.getenv("OPENAI_BASE_URL")
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
+        # "json_schema" (strict structured output) or "json_object" for providers without it.
+        self.response_format = os.getenv("LLM_RESPONSE_FORMAT", "json_schema")
+
+    def response_format_param(self) -> dict[str, Any]:
+        if self.response_format == "json_object":
+            return {"type": "json_object"}
+        return _PICK_SCHEMA
 
     def is_configured(self) -> bool:
         return bool(self.api_key)
@@ -17,66 +34,117 @@ class LLMConfig:
     def client(self) -> OpenAI:
         if not self.is_configured():
             raise RuntimeError("LLM not configured: set OPENAI_API_KEY and optionally LLM_BASE_URL, LLM_MODEL")
-        return OpenAI(api_key=self.api_key, base_url=self.base_url) if self.base_url else OpenAI(api_key=self.api_key)
+        return _client(self.api_key, self.base_url)
 
+    def async_client(self) -> AsyncOpenAI:
+        if not self.is_configured():
+            raise RuntimeError("LLM not configured: set OPENAI_API_KEY and optionally LLM_BASE_URL, LLM_MODEL")
+        return _async_client(self.api_key, self.base_url)
 
-def llm_choose_action(
-    state_summary: str,
-    actions: list[dict[str, Any]],
-    persona: str | None = None,
-    temperature: float | None = None,
-    config: Optional[LLMConfig] = None,
-) -> dict[str, Any]:
-    cfg = config or LLMConfig()
-    if not cfg.is_configured():
-        raise RuntimeError("LLM not configured: set OPENAI_API_KEY and optionally LLM_BASE_URL, LLM_MODEL")
 
-    sys = (
-        "You are an AI agent playing a board game. Think step by step and choose ONE action from the provided legal actions. "
-        "Role-play the given persona, try to win logically, and return STRICT JSON only."
-    )
+_PICK_SCHEMA: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pick",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "pick": {"type": "integer"},
+                "rationale": {"type": "string"},
+            },
+            "required": ["pick", "rationale"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
 
+_SYSTEM_PROMPT = (
+    "You are an AI agent playing a board game. Think step by step and choose ONE action from the provided legal actions. "
+    "Role-play the given persona, try to win logically, and return STRICT JSON only."
+)
+
+
+def _messages(
+    state_summary: str,
+    actions: list[dict[str, Any]],
+    persona: str | None,
+    actions_json: str | None = None,
+) -> list[dict[str, str]]:
     persona_text = persona.strip() if persona else ""
+    if actions_json is None:
+        actions_json = orjson.dumps(actions).decode()
 
     user = (
         f"Persona: {persona_text or 'neutral'}\n"
         f"State:\n{state_summary}\n\n"
         "Legal actions are indexed starting at 0.\n"
-        f"Actions: {json.dumps(actions, ensure_ascii=False)}\n\n"
+        f"Actions: {actions_json}\n\n"
         "Return JSON ONLY in the following schema (no extra text):\n"
         '{"pick": <int index>, "rationale": <short string>}'
     )
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "user", "content": user},
+    ]
 
-    client = cfg.client()
-
-    completion = client.chat.completions.create(
-        model=cfg.model,
-        temperature=temperature if temperature is not None else cfg.temperature,
-        messages=[
-            {"role": "system", "content": sys},
-            {"role": "user", "content": user},
-        ],
-        response_format={"type": "json_object"},
-    )
 
-    content = completion.choices[0].message.content or "{}"
+def _parse_pick(content: str, n_actions: int) -> dict[str, Any]:
+    # Both response formats make the API return a bare JSON object, so no brace scanning.
     try:
-        data = json.loads(content)
-    except Exception:
-        # Best-effort extraction of JSON object
-        start = content.find("{")
-        end = content.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            data = json.loads(content[start : end + 1])
-        else:
-            raise RuntimeError("LLM returned non-JSON content")
-
-    if not isinstance(data.get("pick"), int):
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        raise RuntimeError("LLM returned non-JSON content")
+
+    if not isinstance(data, dict) or not isinstance(data.get("pick"), int):
         raise RuntimeError("LLM response missing integer 'pick'")
 
     idx = data["pick"]
-    if idx < 0 or idx >= len(actions):
+    if idx < 0 or idx >= n_actions:
         raise RuntimeError("LLM pick out of range")
 
     rationale = data.get("rationale", "")
     return {"pick": idx, "rationale": rationale}
+
+
+def llm_choose_action(
+    state_summary: str,
+    actions: list[dict[str, Any]],
+    persona: str | None = None,
+    temperature: float | None = None,
+    config: Optional[LLMConfig] = None,
+    actions_json: str | None = None,
+) -> dict[str, Any]:
+    cfg = config or LLMConfig()
+    client = cfg.client()
+
+    completion = client.chat.completions.create(
+        model=cfg.model,
+        temperature=temperature if temperature is not None else cfg.temperature,
+        messages=_messages(state_summary, actions, persona, actions_json),
+        response_format=cfg.response_format_param(),
+    )
+
+    return _parse_pick(completion.choices[0].message.content or "{}", len(actions))
+
+
+async def llm_choose_action_async(
+    state_summary: str,
+    actions: list[dict[str, Any]],
+    persona: str | None = None,
+    temperature: float | None = None,
+    config: Optional[LLMConfig] = None,
+    actions_json: str | None = None,
+) -> dict[str, Any]:
+    """Same as llm_choose_action, but awaits the completion so the event loop stays free."""
+    cfg = config or LLMConfig()
+    client = cfg.async_client()
+
+    completion = await client.chat.completions.create(
+        model=cfg.model,
+        temperature=temperature if temperature is not None else cfg.temperature,
+        messages=_messages(state_summary, actions, persona, actions_json),
+        response_format=cfg.response_format_param(),
+    )
+
+    return _parse_pick(completion.choices[0].message.content or "{}", len(actions))
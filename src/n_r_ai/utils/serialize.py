@@ -1,6 +1,7 @@
 from __future__ import annotations
-from hashlib import sha256
+from hashlib import blake2b
 
 def state_key(obj: object) -> str:
+    """Memoisation key for ``obj``; a fast non-cryptographic-use digest, not for security."""
     data = repr(obj).encode()
-    return sha256(data).hexdigest()
+    return blake2b(data, digest_size=8).hexdigest()